@@ -203,3 +203,7 @@ POLL_INTERVAL = 1
 MAX_POLLS = 60 // POLL_INTERVAL
 # Stopping instances can take several minutes, so we increase the timeout
 MAX_POLLS_STOP = MAX_POLLS * 8
+
+# The maximum number of concurrent per-instance API calls (start, stop,
+# terminate) issued when operating on the instances of a cluster.
+MAX_PARALLEL_INSTANCE_OPERATIONS = 16
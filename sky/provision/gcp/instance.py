@@ -4,7 +4,8 @@ import copy
 from multiprocessing import pool
 import re
 import time
-from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+from typing import (Any, Callable, Dict, Iterable, List, Optional, Sequence,
+                    Tuple, Type, TypeVar)
 
 from sky import sky_logging
 from sky import status_lib
@@ -24,6 +25,41 @@ TAG_RAY_NODE_KIND = 'ray-node-type'
 _INSTANCE_RESOURCE_NOT_FOUND_PATTERN = re.compile(
     r'The resource \'projects/.*/zones/.*/instances/.*\' was not found')
 
+_T = TypeVar('_T')
+
+# Instance handlers for clusters without and with TPU VMs. Bound once here
+# so each operation only needs a single provider config lookup to pick them.
+_COMPUTE_HANDLERS: Tuple[Type[instance_utils.GCPInstance], ...] = (
+    instance_utils.GCPComputeInstance,)
+_TPU_VM_HANDLERS: Tuple[Type[instance_utils.GCPInstance], ...] = (
+    instance_utils.GCPComputeInstance,
+    instance_utils.GCPTPUVMInstance,
+)
+
+
+def _use_tpu_vms(provider_config: Dict[str, Any]) -> bool:
+    return provider_config.get(constants.HAS_TPU_PROVIDER_FIELD, False)
+
+
+def _get_handlers(
+        provider_config: Dict[str, Any]
+) -> Tuple[Type[instance_utils.GCPInstance], ...]:
+    """Returns the instance handlers for a cluster."""
+    if _use_tpu_vms(provider_config):
+        return _TPU_VM_HANDLERS
+    return _COMPUTE_HANDLERS
+
+
+def _run_in_parallel(func: Callable[..., _T],
+                     args_list: Sequence[Tuple[Any, ...]]) -> List[_T]:
+    """Runs per-instance API calls in parallel, preserving the input order."""
+    if len(args_list) <= 1:
+        return [func(*args) for args in args_list]
+    num_threads = min(len(args_list),
+                      constants.MAX_PARALLEL_INSTANCE_OPERATIONS)
+    with pool.ThreadPool(num_threads) as p:
+        return p.starmap(func, args_list)
+
 
 def _filter_instances(
     handlers: Iterable[Type[instance_utils.GCPInstance]],
@@ -68,11 +104,9 @@ def query_instances(
     project_id = provider_config['project_id']
     label_filters = {TAG_RAY_CLUSTER_NAME: cluster_name_on_cloud}
 
-    handler: Type[
-        instance_utils.GCPInstance] = instance_utils.GCPComputeInstance
-    use_tpu_vms = provider_config.get('_has_tpus', False)
-    if use_tpu_vms:
-        handler = instance_utils.GCPTPUVMInstance
+    handler: Type[instance_utils.GCPInstance] = (
+        instance_utils.GCPTPUVMInstance if _use_tpu_vms(provider_config) else
+        instance_utils.GCPComputeInstance)
 
     instances = handler.filter(
         project_id,
@@ -269,11 +303,16 @@ def _run_instances(region: str, cluster_name_on_cloud: str,
     if config.resume_stopped_nodes and to_start_count > 0 and stopped_instances:
         resumed_instance_ids = [n['name'] for n in stopped_instances]
         if resumed_instance_ids:
-            for instance_id in resumed_instance_ids:
+
+            def _resume_instance(instance_id: str) -> None:
                 resource.start_instance(instance_id, project_id,
                                         availability_zone)
                 resource.set_labels(project_id, availability_zone, instance_id,
                                     labels)
+
+            _run_in_parallel(_resume_instance,
+                             [(instance_id,)
+                              for instance_id in resumed_instance_ids])
         to_start_count -= len(resumed_instance_ids)
 
         if head_instance_id is None:
@@ -382,12 +421,7 @@ def get_cluster_info(
     project_id = provider_config['project_id']
     label_filters = {TAG_RAY_CLUSTER_NAME: cluster_name_on_cloud}
 
-    handlers: List[Type[instance_utils.GCPInstance]] = [
-        instance_utils.GCPComputeInstance
-    ]
-    use_tpu_vms = provider_config.get('_has_tpus', False)
-    if use_tpu_vms:
-        handlers.append(instance_utils.GCPTPUVMInstance)
+    handlers = _get_handlers(provider_config)
 
     handler_to_instances = _filter_instances(
         handlers,
@@ -436,12 +470,7 @@ def stop_instances(
     if worker_only:
         label_filters[TAG_RAY_NODE_KIND] = 'worker'
 
-    handlers: List[Type[instance_utils.GCPInstance]] = [
-        instance_utils.GCPComputeInstance
-    ]
-    use_tpu_vms = provider_config.get('_has_tpus', False)
-    if use_tpu_vms:
-        handlers.append(instance_utils.GCPTPUVMInstance)
+    handlers = _get_handlers(provider_config)
 
     handler_to_instances = _filter_instances(
         handlers,
@@ -456,8 +485,9 @@ def stop_instances(
 
     operations = collections.defaultdict(list)
     for handler, instances in handler_to_instances.items():
-        for instance in instances:
-            operations[handler].append(handler.stop(project_id, zone, instance))
+        operations[handler] = _run_in_parallel(
+            handler.stop,
+            [(project_id, zone, instance) for instance in instances])
     _wait_for_operations(operations, project_id, zone)
     # Check if the instance is actually stopped.
     # GCP does not fully stop an instance even after
@@ -490,35 +520,38 @@ def terminate_instances(
     assert provider_config is not None, cluster_name_on_cloud
     zone = provider_config['availability_zone']
     project_id = provider_config['project_id']
-    use_tpu_vms = provider_config.get('_has_tpus', False)
 
     label_filters = {TAG_RAY_CLUSTER_NAME: cluster_name_on_cloud}
     if worker_only:
         label_filters[TAG_RAY_NODE_KIND] = 'worker'
 
-    handlers: List[Type[instance_utils.GCPInstance]] = [
-        instance_utils.GCPComputeInstance
-    ]
-    if use_tpu_vms:
-        handlers.append(instance_utils.GCPTPUVMInstance)
+    handlers = _get_handlers(provider_config)
 
     handler_to_instances = _filter_instances(handlers, project_id, zone,
                                              label_filters, lambda _: None)
     operations = collections.defaultdict(list)
     errs = []
+
+    def _terminate_instance(handler: Type[instance_utils.GCPInstance],
+                            instance: str) -> Optional[dict]:
+        # Errors are collected instead of raised, so that a failure on one
+        # instance does not abort terminating the others.
+        try:
+            logger.debug(f'Terminating instance: {instance}.')
+            return handler.terminate(project_id, zone, instance)
+        except gcp.http_error_exception() as e:
+            if _INSTANCE_RESOURCE_NOT_FOUND_PATTERN.search(e.reason) is None:
+                errs.append(e)
+            else:
+                logger.warning(f'Instance {instance} does not exist. '
+                               'Skip terminating it.')
+        return None
+
     for handler, instances in handler_to_instances.items():
-        for instance in instances:
-            try:
-                logger.debug(f'Terminating instance: {instance}.')
-                operations[handler].append(
-                    handler.terminate(project_id, zone, instance))
-            except gcp.http_error_exception() as e:
-                if _INSTANCE_RESOURCE_NOT_FOUND_PATTERN.search(
-                        e.reason) is None:
-                    errs.append(e)
-                else:
-                    logger.warning(f'Instance {instance} does not exist. '
-                                   'Skip terminating it.')
+        results = _run_in_parallel(_terminate_instance,
+                                   [(handler, instance)
+                                    for instance in instances])
+        operations[handler] = [op for op in results if op is not None]
     _wait_for_operations(operations, project_id, zone)
     if errs:
         raise RuntimeError(f'Failed to terminate instances: {errs}')
@@ -1,11 +1,12 @@
 """Autoscalers: perform autoscaling by monitoring metrics."""
 import bisect
+import collections
 import dataclasses
 import enum
 import math
 import time
 import typing
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Union
 
 from sky import sky_logging
 from sky.serve import constants
@@ -42,9 +43,9 @@ class AutoscalerDecision:
     def __init__(self, operator: AutoscalerDecisionOperator,
                  target: Union[Optional[Dict[str, Any]], int]):
 
-        assert (operator == AutoscalerDecisionOperator.SCALE_UP and
+        assert (operator is AutoscalerDecisionOperator.SCALE_UP and
                 (target is None or isinstance(target, dict))) or (
-                    operator == AutoscalerDecisionOperator.SCALE_DOWN and
+                    operator is AutoscalerDecisionOperator.SCALE_DOWN and
                     isinstance(target, int))
         self.operator = operator
         self.target = target
@@ -99,33 +100,52 @@ class RequestRateAutoscaler(Autoscaler):
             request_timestamps: All request timestamps within the window.
             upscale_counter: counter for upscale number of replicas.
             downscale_counter: counter for downscale number of replicas.
-            scale_up_consecutive_periods: period for scaling up.
-            scale_down_consecutive_periods: period for scaling down.
+            upscale_delay_seconds: delay before scaling up.
+            downscale_delay_seconds: delay before scaling down.
+            decision_interval_seconds: interval between two decisions.
+            max_decision_interval_seconds: upper bound of the decision
+                interval as it grows with the target number of replicas.
+            settled: whether the last decision found the service at its
+                target with no pending upscale or downscale.
         """
         super().__init__(spec)
         self.target_qps_per_replica: Optional[
             float] = spec.target_qps_per_replica
         self.qps_window_size: int = qps_window_size
-        self.request_timestamps: List[float] = []
+        self.request_timestamps: Deque[float] = collections.deque()
         self.upscale_counter: int = 0
         self.downscale_counter: int = 0
-        upscale_delay_seconds = (
+        self.upscale_delay_seconds: int = (
             spec.upscale_delay_seconds if spec.upscale_delay_seconds is not None
             else constants.AUTOSCALER_DEFAULT_UPSCALE_DELAY_SECONDS)
-        self.scale_up_consecutive_periods: int = int(
-            upscale_delay_seconds /
-            constants.AUTOSCALER_DEFAULT_DECISION_INTERVAL_SECONDS)
-        downscale_delay_seconds = (
+        self.downscale_delay_seconds: int = (
             spec.downscale_delay_seconds
             if spec.downscale_delay_seconds is not None else
             constants.AUTOSCALER_DEFAULT_DOWNSCALE_DELAY_SECONDS)
-        self.scale_down_consecutive_periods: int = int(
-            downscale_delay_seconds /
+        self.decision_interval_seconds: int = (
+            spec.decision_interval_seconds
+            if spec.decision_interval_seconds is not None else
             constants.AUTOSCALER_DEFAULT_DECISION_INTERVAL_SECONDS)
+        self.max_decision_interval_seconds: int = max(
+            self.decision_interval_seconds,
+            spec.max_decision_interval_seconds
+            if spec.max_decision_interval_seconds is not None else
+            constants.AUTOSCALER_DEFAULT_MAX_DECISION_INTERVAL_SECONDS)
         # Target number of replicas is initialized to min replicas.
         # TODO(MaoZiming): add init replica numbers in SkyServe spec.
         self.target_num_replicas: int = spec.min_replicas
         self.bootstrap_done: bool = False
+        self.settled: bool = False
+
+    @property
+    def scale_up_consecutive_periods(self) -> int:
+        # The decision interval varies with the target number of replicas, so
+        # convert the delay to a number of periods of the current interval.
+        return int(self.upscale_delay_seconds / self.get_decision_interval())
+
+    @property
+    def scale_down_consecutive_periods(self) -> int:
+        return int(self.downscale_delay_seconds / self.get_decision_interval())
 
     def collect_request_information(
             self, request_aggregator_info: Dict[str, Any]) -> None:
@@ -137,12 +157,34 @@ class RequestRateAutoscaler(Autoscaler):
             'timestamps': [timestamp1 (float), timestamp2 (float), ...]
         }
         """
-        self.request_timestamps.extend(
-            request_aggregator_info.get('timestamps', []))
-        current_time = time.time()
-        index = bisect.bisect_left(self.request_timestamps,
-                                   current_time - self.qps_window_size)
-        self.request_timestamps = self.request_timestamps[index:]
+        timestamps = request_aggregator_info.get('timestamps', [])
+        cutoff = time.time() - self.qps_window_size
+        if len(timestamps) > 0:
+            if (self.request_timestamps and
+                    timestamps[0] < self.request_timestamps[-1]):
+                # The batch overlaps the window, so appending it would break
+                # the ordering eviction relies on. Merge (sorting two sorted
+                # runs is linear), bisect for the cutoff and rebuild.
+                merged = list(self.request_timestamps)
+                merged.extend(timestamps)
+                merged.sort()
+                index = bisect.bisect_left(merged, cutoff)
+                self.request_timestamps = collections.deque(merged[index:])
+                return
+            if timestamps[0] < cutoff:
+                # The batch starts before the cutoff, e.g. the load balancer
+                # is catching up after failing to reach the controller. The
+                # whole window and a prefix of the batch are expired, so keep
+                # only the suffix of the batch.
+                index = bisect.bisect_left(timestamps, cutoff)
+                self.request_timestamps = collections.deque(timestamps[index:])
+                return
+        self.request_timestamps.extend(timestamps)
+        # Timestamps are appended in increasing order, so expired ones are
+        # always at the left end. Evicting them one by one costs time
+        # proportional to the number of evictions rather than the window size.
+        while self.request_timestamps and self.request_timestamps[0] < cutoff:
+            self.request_timestamps.popleft()
 
     def _get_desired_num_replicas(self) -> int:
         # Always return self.target_num_replicas when autoscaling
@@ -180,13 +222,33 @@ class RequestRateAutoscaler(Autoscaler):
             self.upscale_counter = self.downscale_counter = 0
         return self.target_num_replicas
 
-    def get_decision_interval(self) -> int:
+    def get_decision_interval(self) -> float:
         # Reduce autoscaler interval when target_num_replicas = 0.
         # This will happen when min_replicas = 0 and no traffic.
         if self.target_num_replicas == 0:
             return constants.AUTOSCALER_NO_REPLICA_DECISION_INTERVAL_SECONDS
-        else:
-            return constants.AUTOSCALER_DEFAULT_DECISION_INTERVAL_SECONDS
+        # Each decision reads and scans all replicas, so poll less often for
+        # large services. Services with no more than
+        # AUTOSCALER_DECISION_INTERVAL_REPLICA_BASE replicas use the base
+        # interval.
+        scale = math.sqrt(self.target_num_replicas /
+                          constants.AUTOSCALER_DECISION_INTERVAL_REPLICA_BASE)
+        interval = min(self.max_decision_interval_seconds,
+                       max(self.decision_interval_seconds,
+                           self.decision_interval_seconds * scale))
+        # Poll less often while nothing is changing. Any upscale or downscale
+        # tendency clears `settled` and restores the regular interval; the
+        # consecutive periods are derived from this interval, so the delays
+        # stay approximately the same.
+        if self.settled:
+            max_quiet_interval = min(
+                constants.AUTOSCALER_MAX_QUIET_DECISION_INTERVAL_SECONDS,
+                self.qps_window_size)
+            interval = min(
+                interval *
+                constants.AUTOSCALER_QUIET_DECISION_INTERVAL_MULTIPLIER,
+                max(interval, max_quiet_interval))
+        return interval
 
     def evaluate_scaling(
         self,
@@ -201,10 +263,18 @@ class RequestRateAutoscaler(Autoscaler):
         override dict. Active migration could require returning both SCALE_UP
         and SCALE_DOWN.
         """
-        launched_replica_infos = [
-            info for info in replica_infos if info.is_launched
-        ]
-        num_launched_replicas = len(launched_replica_infos)
+        # `info.status` is derived from the status property on every access,
+        # so compute it once per replica and group launched replicas by it.
+        launched_statuses = serve_state.ReplicaStatus.launched_statuses()
+        launched_replica_ids_by_status: Dict[
+            serve_state.ReplicaStatus,
+            List[int]] = collections.defaultdict(list)
+        num_launched_replicas = 0
+        for info in replica_infos:
+            status = info.status
+            if status in launched_statuses:
+                launched_replica_ids_by_status[status].append(info.replica_id)
+                num_launched_replicas += 1
 
         self.target_num_replicas = self._get_desired_num_replicas()
         logger.info(
@@ -215,41 +285,51 @@ class RequestRateAutoscaler(Autoscaler):
             f'{self.scale_down_consecutive_periods} '
             f'Number of launched replicas: {num_launched_replicas}')
 
-        scaling_options = []
-        all_replica_ids_to_scale_down: List[int] = []
+        # Only autoscaled services are deferred when settled, so that a fixed
+        # service still replaces failed replicas at the regular interval.
+        self.settled = (self.target_qps_per_replica is not None and
+                        num_launched_replicas == self.target_num_replicas and
+                        self.upscale_counter == 0 and
+                        self.downscale_counter == 0)
 
-        def _get_replica_ids_to_scale_down(num_limit: int) -> List[int]:
+        # Most ticks need no scaling; skip building the decision list.
+        if num_launched_replicas == self.target_num_replicas:
+            logger.info('No scaling needed.')
+            return []
 
-            status_order = serve_state.ReplicaStatus.scale_down_decision_order()
-            launched_replica_infos_sorted = sorted(
-                launched_replica_infos,
-                key=lambda info: status_order.index(info.status)
-                if info.status in status_order else len(status_order))
+        scaling_options: List[AutoscalerDecision] = []
 
-            return [info.replica_id for info in launched_replica_infos_sorted
-                   ][:num_limit]
+        def _get_replica_ids_to_scale_down(num_limit: int) -> List[int]:
+            # Take replicas status by status in the scale down decision order,
+            # keeping the original order within each status.
+            replica_ids: List[int] = []
+            for status in serve_state.ReplicaStatus.scale_down_decision_order():
+                if len(replica_ids) >= num_limit:
+                    break
+                replica_ids.extend(
+                    launched_replica_ids_by_status.get(status, []))
+            return replica_ids[:num_limit]
 
         if num_launched_replicas < self.target_num_replicas:
             num_replicas_to_scale_up = (self.target_num_replicas -
                                         num_launched_replicas)
 
-            for _ in range(num_replicas_to_scale_up):
-                scaling_options.append(
-                    AutoscalerDecision(AutoscalerDecisionOperator.SCALE_UP,
-                                       target=None))
+            # All scale-up decisions share the same (empty) resources
+            # override and are never mutated by the caller, so build the
+            # decision once and repeat it.
+            scaling_options.extend([
+                AutoscalerDecision(AutoscalerDecisionOperator.SCALE_UP,
+                                   target=None)
+            ] * num_replicas_to_scale_up)
 
         elif num_launched_replicas > self.target_num_replicas:
             num_replicas_to_scale_down = (num_launched_replicas -
                                           self.target_num_replicas)
-            all_replica_ids_to_scale_down.extend(
-                _get_replica_ids_to_scale_down(
-                    num_limit=num_replicas_to_scale_down))
-
-        for replica_id in all_replica_ids_to_scale_down:
-            scaling_options.append(
+            scaling_options.extend([
                 AutoscalerDecision(AutoscalerDecisionOperator.SCALE_DOWN,
-                                   target=replica_id))
+                                   target=replica_id)
+                for replica_id in _get_replica_ids_to_scale_down(
+                    num_limit=num_replicas_to_scale_down)
+            ])
 
-        if not scaling_options:
-            logger.info('No scaling needed.')
         return scaling_options
@@ -20,6 +20,10 @@ INITIALIZATION_TIMEOUT_SECONDS = 60
 # replica ips for each service, also send the number of requests in last query
 # interval.
 LB_CONTROLLER_SYNC_INTERVAL_SECONDS = 20
+# Content type of the load balancer sync request when the request timestamps
+# are sent as packed binary doubles instead of JSON. The load balancer and the
+# controller run on the same VM, so native byte order is used.
+LB_CONTROLLER_SYNC_BINARY_CONTENT_TYPE = 'application/octet-stream'
 
 # Interval in seconds to probe replica endpoint.
 ENDPOINT_PROBE_INTERVAL_SECONDS = 10
@@ -38,6 +42,22 @@ AUTOSCALER_QPS_WINDOW_SIZE_SECONDS = 60
 AUTOSCALER_DEFAULT_DECISION_INTERVAL_SECONDS = 20
 # Autoscaler no replica decision interval in seconds.
 AUTOSCALER_NO_REPLICA_DECISION_INTERVAL_SECONDS = 5
+# Autoscaler max decision interval in seconds. Each decision does work linear
+# in the number of replicas, so the interval grows with the target number of
+# replicas (by sqrt(target / AUTOSCALER_DECISION_INTERVAL_REPLICA_BASE)) and is
+# capped by this value.
+AUTOSCALER_DEFAULT_MAX_DECISION_INTERVAL_SECONDS = 60
+AUTOSCALER_DECISION_INTERVAL_REPLICA_BASE = 10
+# When the previous decision found the service settled at its target with no
+# pending upscale or downscale, the next decision is deferred by this
+# multiple of the decision interval, capped at the max quiet interval and at
+# the QPS window size (but never below the regular interval).
+# Trade-off: the controller does not look at replicas while deferred, so a
+# failed or preempted replica of a settled service waits up to the quiet
+# interval (40s by default, vs. 20s) for its replacement. The cap at the QPS
+# window size keeps every request sampled by at least one decision.
+AUTOSCALER_QUIET_DECISION_INTERVAL_MULTIPLIER = 2
+AUTOSCALER_MAX_QUIET_DECISION_INTERVAL_SECONDS = 40
 # Autoscaler default upscale delays in seconds.
 # We will upscale only if the target number of instances
 # is larger than the current launched instances for delay amount of time.
@@ -8,6 +8,7 @@ import time
 import traceback
 
 import fastapi
+import orjson
 import uvicorn
 
 from sky import serve
@@ -16,6 +17,7 @@ from sky.serve import autoscalers
 from sky.serve import constants
 from sky.serve import replica_managers
 from sky.serve import serve_state
+from sky.serve import serve_utils
 from sky.utils import common_utils
 from sky.utils import env_options
 from sky.utils import ux_utils
@@ -50,29 +52,40 @@ class SkyServeController:
                 service_spec,
                 qps_window_size=constants.AUTOSCALER_QPS_WINDOW_SIZE_SECONDS))
         self._port = port
-        self._app = fastapi.FastAPI()
+        # orjson encodes responses in C, instead of the pure Python
+        # json.dumps used by the default JSONResponse.
+        self._app = fastapi.FastAPI(
+            default_response_class=fastapi.responses.ORJSONResponse)
 
     def _run_autoscaler(self):
         logger.info('Starting autoscaler.')
         while True:
             try:
                 replica_info = serve_state.get_replica_infos(self._service_name)
-                replica_info_dicts = [
-                    info.to_info_dict(
-                        with_handle=env_options.Options.SHOW_DEBUG_INFO.get())
-                    for info in replica_info
-                ]
-                logger.info(f'All replica info: {replica_info_dicts}')
+                # to_info_dict() looks up the cluster table for every replica,
+                # so only build the full dicts when debug info is requested.
+                if env_options.Options.SHOW_DEBUG_INFO.get():
+                    replica_info_dicts = [
+                        info.to_info_dict(with_handle=True)
+                        for info in replica_info
+                    ]
+                    logger.debug(f'All replica info: {replica_info_dicts}')
+                else:
+                    replica_statuses = {
+                        info.replica_id: info.status.value
+                        for info in replica_info
+                    }
+                    logger.info(f'All replica statuses: {replica_statuses}')
                 scaling_options = self._autoscaler.evaluate_scaling(
                     replica_info)
                 for scaling_option in scaling_options:
                     logger.info(f'Scaling option received: {scaling_option}')
-                    if (scaling_option.operator ==
+                    if (scaling_option.operator is
                             autoscalers.AutoscalerDecisionOperator.SCALE_UP):
                         assert (scaling_option.target is None or isinstance(
                             scaling_option.target, dict)), scaling_option
                         self._replica_manager.scale_up(scaling_option.target)
-                    elif (scaling_option.operator ==
+                    elif (scaling_option.operator is
                           autoscalers.AutoscalerDecisionOperator.SCALE_DOWN):
                         assert isinstance(scaling_option.target,
                                           int), scaling_option
@@ -94,10 +107,31 @@ class SkyServeController:
 
         @self._app.post('/controller/load_balancer_sync')
         async def load_balancer_sync(request: fastapi.Request):
-            request_data = await request.json()
-            request_aggregator = request_data.get('request_aggregator')
-            logger.info(
-                f'Received inflight request information: {request_aggregator}')
+            if (request.headers.get('content-type') ==
+                    constants.LB_CONTROLLER_SYNC_BINARY_CONTENT_TYPE):
+                try:
+                    request_aggregator = (
+                        serve_utils.RequestTimestamp.bytes_to_aggregator_dict(
+                            await request.body()))
+                except ValueError as e:
+                    logger.error(
+                        'Malformed request information from load balancer: '
+                        f'{common_utils.format_exception(e)}')
+                    raise fastapi.HTTPException(
+                        status_code=400,
+                        detail='Malformed request timestamps payload.') from e
+            else:
+                request_data = orjson.loads(await request.body())
+                request_aggregator = request_data.get('request_aggregator')
+            # The aggregator carries every request timestamp since the last
+            # sync, so only dump it in full when debug info is requested.
+            if env_options.Options.SHOW_DEBUG_INFO.get():
+                logger.debug('Received inflight request information: '
+                             f'{request_aggregator}')
+            else:
+                num_timestamps = len(request_aggregator.get('timestamps', []))
+                logger.info('Received inflight request information: '
+                            f'{num_timestamps} request timestamps.')
             self._autoscaler.collect_request_information(request_aggregator)
             return {
                 'ready_replica_urls':
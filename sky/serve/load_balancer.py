@@ -56,12 +56,14 @@ class SkyServeLoadBalancer:
         while True:
             with requests.Session() as session:
                 try:
-                    # Send request information
+                    # Send request information as packed binary to avoid
+                    # JSON encoding and decoding every request timestamp.
                     response = session.post(
                         self._controller_url + '/controller/load_balancer_sync',
-                        json={
-                            'request_aggregator':
-                                self._request_aggregator.to_dict()
+                        data=self._request_aggregator.to_bytes(),
+                        headers={
+                            'Content-Type':
+                                constants.LB_CONTROLLER_SYNC_BINARY_CONTENT_TYPE
                         },
                         timeout=5)
                     # Clean up after reporting request information to avoid OOM.
@@ -70,7 +72,7 @@ class SkyServeLoadBalancer:
                     ready_replica_urls = response.json().get(
                         'ready_replica_urls')
                 except requests.RequestException as e:
-                    print(f'An error occurred: {e}')
+                    logger.error(f'An error occurred: {e}')
                 else:
                     logger.info(f'Available Replica URLs: {ready_replica_urls}')
                     self._load_balancing_policy.set_ready_replicas(
@@ -88,7 +90,7 @@ class SkyServeLoadBalancer:
                                         'to check the replica status.')
 
         path = f'http://{ready_replica_url}{request.url.path}'
-        logger.info(f'Redirecting request to {path}')
+        logger.debug(f'Redirecting request to {path}')
         return fastapi.responses.RedirectResponse(url=path)
 
     def run(self):
@@ -1,4 +1,5 @@
 """User interface with the SkyServe."""
+import array
 import base64
 import enum
 import os
@@ -135,6 +136,10 @@ class RequestsAggregator:
         """Convert the aggregator to a dict."""
         raise NotImplementedError
 
+    def to_bytes(self) -> bytes:
+        """Convert the aggregator to a compact binary payload."""
+        raise NotImplementedError
+
     def __repr__(self) -> str:
         raise NotImplementedError
 
@@ -161,6 +166,25 @@ class RequestTimestamp(RequestsAggregator):
         """Convert the aggregator to a dict."""
         return {'timestamps': self.timestamps}
 
+    def to_bytes(self) -> bytes:
+        """Convert the aggregator to packed native-endian doubles."""
+        return array.array('d', self.timestamps).tobytes()
+
+    @staticmethod
+    def bytes_to_aggregator_dict(data: bytes) -> Dict[str, Any]:
+        """Decode the payload of to_bytes() to the format of to_dict().
+
+        The timestamps are returned as an array.array of doubles, which the
+        autoscaler consumes as any other sequence of floats.
+
+        Raises:
+            ValueError: if the payload length is not a multiple of the size
+                of a double.
+        """
+        timestamps = array.array('d')
+        timestamps.frombytes(data)
+        return {'timestamps': timestamps}
+
     def __repr__(self) -> str:
         return f'RequestTimestamp(timestamps={self.timestamps})'
 
@@ -550,12 +574,13 @@ def stream_replica_logs(service_name: str,
                 f'{colorama.Style.RESET_ALL}')
 
     def _get_replica_status() -> serve_state.ReplicaStatus:
-        replica_info = serve_state.get_replica_infos(service_name)
-        for info in replica_info:
-            if info.replica_id == replica_id:
-                return info.status
-        raise ValueError(
-            _FAILED_TO_FIND_REPLICA_MSG.format(replica_id=replica_id))
+        # This is polled while following the logs, so only fetch the row of
+        # this replica instead of all replicas of the service.
+        info = serve_state.get_replica_info_from_id(service_name, replica_id)
+        if info is None:
+            raise ValueError(
+                _FAILED_TO_FIND_REPLICA_MSG.format(replica_id=replica_id))
+        return info.status
 
     finish_stream = (
         lambda: _get_replica_status() != serve_state.ReplicaStatus.PROVISIONING)
@@ -25,6 +25,8 @@ class SkyServiceSpec:
         post_data: Optional[Dict[str, Any]] = None,
         upscale_delay_seconds: Optional[int] = None,
         downscale_delay_seconds: Optional[int] = None,
+        decision_interval_seconds: Optional[int] = None,
+        max_decision_interval_seconds: Optional[int] = None,
         # The following arguments are deprecated.
         # TODO(ziming): remove this after 2 minor release, i.e. 0.6.0.
         # Deprecated: Always be True
@@ -41,6 +43,26 @@ class SkyServiceSpec:
                 raise ValueError(
                     'max_replicas must be greater than or equal to min_replicas'
                 )
+        if (decision_interval_seconds is not None and
+                decision_interval_seconds <= 0):
+            with ux_utils.print_exception_no_traceback():
+                raise ValueError(
+                    'decision_interval_seconds must be greater than 0')
+        if max_decision_interval_seconds is not None:
+            base_decision_interval_seconds = (
+                decision_interval_seconds
+                if decision_interval_seconds is not None else
+                constants.AUTOSCALER_DEFAULT_DECISION_INTERVAL_SECONDS)
+            if max_decision_interval_seconds <= 0:
+                with ux_utils.print_exception_no_traceback():
+                    raise ValueError(
+                        'max_decision_interval_seconds must be greater than 0')
+            if max_decision_interval_seconds < base_decision_interval_seconds:
+                with ux_utils.print_exception_no_traceback():
+                    raise ValueError(
+                        'max_decision_interval_seconds must be greater than '
+                        'or equal to decision_interval_seconds '
+                        f'({base_decision_interval_seconds}s)')
         if not readiness_path.startswith('/'):
             with ux_utils.print_exception_no_traceback():
                 raise ValueError('readiness_path must start with a slash (/). '
@@ -68,6 +90,8 @@ class SkyServiceSpec:
         self._post_data = post_data
         self._upscale_delay_seconds = upscale_delay_seconds
         self._downscale_delay_seconds = downscale_delay_seconds
+        self._decision_interval_seconds = decision_interval_seconds
+        self._max_decision_interval_seconds = max_decision_interval_seconds
 
     @staticmethod
     def from_yaml_config(config: Dict[str, Any]) -> 'SkyServiceSpec':
@@ -117,6 +141,8 @@ class SkyServiceSpec:
             service_config['target_qps_per_replica'] = None
             service_config['upscale_delay_seconds'] = None
             service_config['downscale_delay_seconds'] = None
+            service_config['decision_interval_seconds'] = None
+            service_config['max_decision_interval_seconds'] = None
         else:
             service_config['min_replicas'] = policy_section['min_replicas']
             service_config['max_replicas'] = policy_section.get(
@@ -133,6 +159,10 @@ class SkyServiceSpec:
                 'upscale_delay_seconds', None)
             service_config['downscale_delay_seconds'] = policy_section.get(
                 'downscale_delay_seconds', None)
+            service_config['decision_interval_seconds'] = policy_section.get(
+                'decision_interval_seconds', None)
+            service_config['max_decision_interval_seconds'] = (
+                policy_section.get('max_decision_interval_seconds', None))
 
         return SkyServiceSpec(**service_config)
 
@@ -182,6 +212,10 @@ class SkyServiceSpec:
                         self.upscale_delay_seconds)
         add_if_not_none('replica_policy', 'downscale_delay_seconds',
                         self.downscale_delay_seconds)
+        add_if_not_none('replica_policy', 'decision_interval_seconds',
+                        self.decision_interval_seconds)
+        add_if_not_none('replica_policy', 'max_decision_interval_seconds',
+                        self.max_decision_interval_seconds)
 
         return config
 
@@ -239,3 +273,11 @@ class SkyServiceSpec:
     @property
     def downscale_delay_seconds(self) -> Optional[int]:
         return self._downscale_delay_seconds
+
+    @property
+    def decision_interval_seconds(self) -> Optional[int]:
+        return self._decision_interval_seconds
+
+    @property
+    def max_decision_interval_seconds(self) -> Optional[int]:
+        return self._max_decision_interval_seconds
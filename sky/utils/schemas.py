@@ -340,6 +340,12 @@ def get_service_schema():
                     'downscale_delay_seconds': {
                         'type': 'number',
                     },
+                    'decision_interval_seconds': {
+                        'type': 'number',
+                    },
+                    'max_decision_interval_seconds': {
+                        'type': 'number',
+                    },
                     # TODO(MaoZiming): Fields `qps_upper_threshold`,
                     # `qps_lower_threshold` and `auto_restart` are deprecated.
                     # Temporarily keep these fields for backward compatibility.
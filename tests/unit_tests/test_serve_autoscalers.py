@@ -0,0 +1,161 @@
+import array
+import time
+from unittest import mock
+
+import pytest
+
+from sky.serve import autoscalers
+from sky.serve import constants
+from sky.serve import serve_state
+from sky.serve import service_spec
+
+_QPS_WINDOW_SIZE = 60
+_NOW = 1_000_000.0
+
+
+def _make_autoscaler(
+        qps_window_size: int = _QPS_WINDOW_SIZE,
+        **spec_kwargs) -> autoscalers.RequestRateAutoscaler:
+    spec_kwargs.setdefault('min_replicas', 1)
+    spec_kwargs.setdefault('max_replicas', 1000)
+    spec_kwargs.setdefault('target_qps_per_replica', 1)
+    spec = service_spec.SkyServiceSpec(readiness_path='/',
+                                       initial_delay_seconds=10,
+                                       **spec_kwargs)
+    return autoscalers.RequestRateAutoscaler(spec,
+                                             qps_window_size=qps_window_size)
+
+
+def _ready_replica(replica_id: int) -> mock.Mock:
+    return mock.Mock(replica_id=replica_id,
+                     status=serve_state.ReplicaStatus.READY)
+
+
+# Each step is (seconds since _NOW, batch of timestamps as offsets to _NOW).
+@pytest.mark.parametrize(
+    'steps',
+    [
+        # In-order batches, some timestamps expire over time.
+        [(0, [-70, -50, -10]), (20, [5, 15]), (40, [30, 35])],
+        # Empty batches.
+        [(0, []), (20, [10, 15]), (40, []), (100, [])],
+        # Catch-up: the batch starts before the cutoff.
+        [(0, [-30, -10]), (20, [-100, -45, -35, 18])],
+        # Catch-up with every timestamp of the batch expired.
+        [(0, [-5]), (20, [-200, -150])],
+        # Overlap: the batch starts before the end of the window.
+        [(0, [-20, -5]), (20, [-15, -1, 10]), (40, [0, 39])],
+        # Overlap that also reaches past the cutoff.
+        [(0, [-10, -2]), (20, [-70, -3, 19])],
+        # A single large batch, as sent by a busy load balancer.
+        [(0, [-60 + i * 0.01 for i in range(6000)]),
+         (20, [i * 0.01 for i in range(2000)])],
+    ])
+@pytest.mark.parametrize('use_array', [False, True])
+def test_request_window_matches_brute_force(monkeypatch, steps, use_array):
+    autoscaler = _make_autoscaler()
+    all_timestamps = []
+    for elapsed, offsets in steps:
+        now = _NOW + elapsed
+        monkeypatch.setattr(time, 'time', lambda now=now: now)
+        batch = [_NOW + offset for offset in offsets]
+        all_timestamps.extend(batch)
+        timestamps = array.array('d', batch) if use_array else batch
+        autoscaler.collect_request_information({'timestamps': timestamps})
+        expected = sorted(
+            t for t in all_timestamps if t >= now - _QPS_WINDOW_SIZE)
+        assert list(autoscaler.request_timestamps) == expected
+
+
+def test_request_window_without_timestamps_key(monkeypatch):
+    monkeypatch.setattr(time, 'time', lambda: _NOW)
+    autoscaler = _make_autoscaler()
+    autoscaler.collect_request_information({'timestamps': [_NOW - 1]})
+    autoscaler.collect_request_information({})
+    assert list(autoscaler.request_timestamps) == [_NOW - 1]
+
+
+@pytest.mark.parametrize(
+    'target_num_replicas, expected_interval',
+    [
+        (0, constants.AUTOSCALER_NO_REPLICA_DECISION_INTERVAL_SECONDS),
+        (1, 20),
+        (10, 20),
+        # sqrt(40 / 10) * 20
+        (40, 40),
+        # Capped at the max decision interval.
+        (1000, 60),
+    ])
+def test_decision_interval_scales_with_target(target_num_replicas,
+                                              expected_interval):
+    autoscaler = _make_autoscaler()
+    autoscaler.target_num_replicas = target_num_replicas
+    assert autoscaler.get_decision_interval() == pytest.approx(
+        expected_interval)
+
+
+@pytest.mark.parametrize('target_num_replicas, expected_interval',
+                         [(1, 5), (40, 10), (1000, 15)])
+def test_decision_interval_from_spec(target_num_replicas, expected_interval):
+    autoscaler = _make_autoscaler(decision_interval_seconds=5,
+                                  max_decision_interval_seconds=15)
+    autoscaler.target_num_replicas = target_num_replicas
+    assert autoscaler.get_decision_interval() == pytest.approx(
+        expected_interval)
+
+
+def test_consecutive_periods_follow_decision_interval():
+    autoscaler = _make_autoscaler(upscale_delay_seconds=300,
+                                  downscale_delay_seconds=1200)
+    autoscaler.target_num_replicas = 1
+    assert autoscaler.scale_up_consecutive_periods == 15
+    assert autoscaler.scale_down_consecutive_periods == 60
+    autoscaler.target_num_replicas = 40
+    assert autoscaler.scale_up_consecutive_periods == 7
+    assert autoscaler.scale_down_consecutive_periods == 30
+
+
+@pytest.mark.parametrize(
+    'qps_window_size, target_num_replicas, expected_interval',
+    [
+        # 2x the regular interval, capped at the max quiet interval.
+        (60, 1, 40),
+        # Capped at the QPS window size.
+        (30, 1, 30),
+        # Never below the regular interval.
+        (60, 40, 40),
+        (60, 1000, 60),
+        # No replica interval is not deferred.
+        (60, 0, constants.AUTOSCALER_NO_REPLICA_DECISION_INTERVAL_SECONDS),
+    ])
+def test_settled_decision_interval(qps_window_size, target_num_replicas,
+                                   expected_interval):
+    autoscaler = _make_autoscaler(qps_window_size=qps_window_size)
+    autoscaler.target_num_replicas = target_num_replicas
+    autoscaler.settled = True
+    assert autoscaler.get_decision_interval() == pytest.approx(
+        expected_interval)
+
+
+def test_evaluate_scaling_sets_settled(monkeypatch):
+    monkeypatch.setattr(time, 'time', lambda: _NOW)
+    autoscaler = _make_autoscaler()
+    assert autoscaler.evaluate_scaling([_ready_replica(1)]) == []
+    assert autoscaler.settled
+    assert autoscaler.get_decision_interval() == pytest.approx(40)
+
+    # A missing replica clears the flag and restores the regular interval.
+    decisions = autoscaler.evaluate_scaling([])
+    assert [d.operator for d in decisions
+           ] == [autoscalers.AutoscalerDecisionOperator.SCALE_UP]
+    assert not autoscaler.settled
+    assert autoscaler.get_decision_interval() == pytest.approx(20)
+
+
+def test_fixed_replicas_never_settled(monkeypatch):
+    monkeypatch.setattr(time, 'time', lambda: _NOW)
+    autoscaler = _make_autoscaler(max_replicas=None,
+                                  target_qps_per_replica=None)
+    assert autoscaler.evaluate_scaling([_ready_replica(1)]) == []
+    assert not autoscaler.settled
+    assert autoscaler.get_decision_interval() == pytest.approx(20)
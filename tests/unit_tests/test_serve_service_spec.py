@@ -0,0 +1,83 @@
+import pytest
+
+from sky.serve import service_spec
+
+
+def _service_config(**policy):
+    return {
+        'readiness_probe': '/health',
+        'replica_policy': {
+            'min_replicas': 1,
+            'max_replicas': 3,
+            'target_qps_per_replica': 1,
+            **policy,
+        },
+    }
+
+
+def test_decision_interval_round_trip():
+    spec = service_spec.SkyServiceSpec.from_yaml_config(
+        _service_config(decision_interval_seconds=10,
+                        max_decision_interval_seconds=30))
+    assert spec.decision_interval_seconds == 10
+    assert spec.max_decision_interval_seconds == 30
+
+    config = spec.to_yaml_config()
+    assert config['replica_policy']['decision_interval_seconds'] == 10
+    assert config['replica_policy']['max_decision_interval_seconds'] == 30
+
+    spec = service_spec.SkyServiceSpec.from_yaml_config(config)
+    assert spec.decision_interval_seconds == 10
+    assert spec.max_decision_interval_seconds == 30
+
+
+@pytest.mark.parametrize('config', [
+    _service_config(),
+    {
+        'readiness_probe': '/health',
+        'replicas': 2
+    },
+])
+def test_decision_interval_defaults(config):
+    spec = service_spec.SkyServiceSpec.from_yaml_config(config)
+    assert spec.decision_interval_seconds is None
+    assert spec.max_decision_interval_seconds is None
+    replica_policy = spec.to_yaml_config()['replica_policy']
+    assert 'decision_interval_seconds' not in replica_policy
+    assert 'max_decision_interval_seconds' not in replica_policy
+
+
+def test_max_decision_interval_alone():
+    spec = service_spec.SkyServiceSpec.from_yaml_config(
+        _service_config(max_decision_interval_seconds=120))
+    assert spec.decision_interval_seconds is None
+    assert spec.max_decision_interval_seconds == 120
+
+
+@pytest.mark.parametrize(
+    'policy',
+    [
+        {
+            'decision_interval_seconds': 0
+        },
+        {
+            'decision_interval_seconds': -1
+        },
+        {
+            'max_decision_interval_seconds': 0
+        },
+        {
+            'max_decision_interval_seconds': -1
+        },
+        # Below the default decision interval (20s).
+        {
+            'max_decision_interval_seconds': 5
+        },
+        {
+            'decision_interval_seconds': 10,
+            'max_decision_interval_seconds': 5
+        },
+    ])
+def test_invalid_decision_interval(policy):
+    with pytest.raises(ValueError):
+        service_spec.SkyServiceSpec.from_yaml_config(_service_config(**policy))